@@ -136,7 +136,7 @@ class Arrow:
             if scan != cod:
                 raise AxiomError(messages.does_not_compose(
                     boxes[-1] if boxes else Id(dom), Id(cod)))
-        self._dom, self._cod, self._boxes = dom, cod, boxes
+        self._dom, self._cod, self._boxes = dom, cod, tuple(boxes)
 
     @property
     def dom(self):
@@ -407,7 +407,7 @@ class Box(Arrow):
         if not str(name):
             raise ValueError(messages.empty_name(name))
         self._name, self._dom, self._cod = name, dom, cod
-        self._boxes, self._dagger, self._data = [self], _dagger, data
+        self._boxes, self._dagger, self._data = (self, ), _dagger, data
         Arrow.__init__(self, dom, cod, [self], _scan=False)
 
     @property
@@ -448,8 +448,20 @@ class Box(Arrow):
         return self._dagger
 
     def dagger(self):
-        return type(self)(self.name, self.cod, self.dom, data=self.data,
-                          _dagger=not self._dagger)
+        """
+        The dagger of a box is only built once, and its dagger is self.
+
+        >>> f = Box('f', Ob('x'), Ob('y'))
+        >>> assert f.dagger() is f.dagger() and f.dagger().dagger() is f
+        """
+        try:
+            return self._dagger_box
+        except AttributeError:
+            self._dagger_box = type(self)(
+                self.name, self.cod, self.dom, data=self.data,
+                _dagger=not self._dagger)
+            self._dagger_box._dagger_box = self
+            return self._dagger_box
 
     def __getitem__(self, key):
         if key == slice(None, None, -1):
@@ -145,6 +145,11 @@ class Circuit(Diagram):
         ...                     circuit.interchange(3, 0, left=True).boxes)))
         Ket(0), sqrt(2), Ket(1, 0), CX, SWAP
         """
+        if j < i - 1 or j > i + 1:
+            step, result = (-1 if j < i else 1), self
+            for k in range(i, j, step):
+                result = result.interchange(k, k + step, left=left)
+            return result
         if i == j + 1 and isinstance(self.boxes[i], Ket)\
                 and len(self.boxes[i].bitstring) == 1:
             try:
@@ -167,6 +172,21 @@ class Circuit(Diagram):
         else:
             return super().interchange(i, j, left=left)
 
+    def foliation(self):
+        """
+        Kets which do not commute are moved with a swap, see
+        :meth:`interchange`, so circuits are foliated by rewriting.
+
+        >>> circuit = H @ Id(1) >> CX >> Id(1) @ Ket(0) @ Id(1)
+        >>> print(', '.join(map(str, circuit.foliation().boxes)))
+        Ket(0) @ Id(2) >> Id(1) @ H @ Id(1), Id(1) @ CX, SWAP @ Id(1)
+        """
+        *_, slices = self.foliate(yield_slices=True)
+        return Circuit(self.dom, self.cod, slices, len(slices) * [0])
+
+    def _slice_count(self):
+        return len(self.foliation())
+
     def normalize(self, _dagger=False):
         """
         Multiplies all the scalars in the diagram.
@@ -31,13 +31,12 @@ def diagram_to_nx(diagram, scale=(1, 1), pad=(0, 0)):
         * :code:`positions` is a dict from nodes to pairs of floats,
         * :code:`labels` is a dict from nodes to strings.
     """
-    graph, pos, labels = nx.DiGraph(), dict(), dict()
+    pos, labels, edges = dict(), dict(), list()
 
     def add_node(node, position, label=None):
-        graph.add_node(node)
-        pos.update({node: position})
+        pos[node] = position
         if label is not None:
-            labels.update({node: label})
+            labels[node] = label
 
     def add_box(scan, box, off, depth, x_pos):
         node = 'wire_box_{}'.format(depth) if box.name in WIRE_BOXES\
@@ -48,16 +47,14 @@ def diagram_to_nx(diagram, scale=(1, 1), pad=(0, 0)):
             wire, position = 'wire_dom_{}_{}'.format(depth, i), (
                 pos[scan[off + i]][0], len(diagram) - depth - .25)
             add_node(wire, position, str(box.dom[i]))
-            graph.add_edge(scan[off + i], wire)
-            graph.add_edge(wire, node)
+            edges.extend([(scan[off + i], wire), (wire, node)])
         for i, _ in enumerate(box.cod):
             wire, position = 'wire_cod_{}_{}'.format(depth, i), (
                 x_pos - len(box.cod[1:]) / 2 + i, len(diagram) - depth - .75)
             add_node(wire, position, str(box.cod[i]))
-            graph.add_edge(node, wire)
-        return scan[:off] + ['wire_cod_{}_{}'.format(depth, i)
-                             for i, _ in enumerate(box.cod)]\
-            + scan[off + len(box.dom):]
+            edges.append((node, wire))
+        scan[off:off + len(box.dom)] = [
+            'wire_cod_{}_{}'.format(depth, i) for i, _ in enumerate(box.cod)]
 
     def make_space(scan, box, off):
         if not scan:
@@ -77,16 +74,14 @@ def diagram_to_nx(diagram, scale=(1, 1), pad=(0, 0)):
         if off and pos[scan[off - 1]][0] > x_pos - half_width:
             limit = pos[scan[off - 1]][0]
             pad = limit - x_pos + half_width
-            for node, position in pos.items():
-                if position[0] <= limit:
-                    pos[node] = (pos[node][0] - pad, pos[node][1])
+            pos.update({node: (x - pad, y)
+                        for node, (x, y) in pos.items() if x <= limit})
         if off + len(box.dom) < len(scan)\
                 and pos[scan[off + len(box.dom)]][0] < x_pos + half_width:
             limit = pos[scan[off + len(box.dom)]][0]
             pad = x_pos + half_width - limit
-            for node, position in pos.items():
-                if position[0] >= limit:
-                    pos[node] = (pos[node][0] + pad, pos[node][1])
+            pos.update({node: (x + pad, y)
+                        for node, (x, y) in pos.items() if x >= limit})
         return x_pos
 
     def scale_and_pad(pos):
@@ -113,11 +108,14 @@ def diagram_to_nx(diagram, scale=(1, 1), pad=(0, 0)):
     scan = ['input_{}'.format(i) for i, _ in enumerate(diagram.dom)]
     for depth, (box, off) in enumerate(zip(diagram.boxes, diagram.offsets)):
         x_pos = make_space(scan, box, off)
-        scan = add_box(scan, box, off, depth, x_pos)
+        add_box(scan, box, off, depth, x_pos)
     for i, _ in enumerate(diagram.cod):
         add_node('output_{}'.format(i),
                  (pos[scan[i]][0], 0), str(diagram.cod[i]))
-        graph.add_edge(scan[i], 'output_{}'.format(i))
+        edges.append((scan[i], 'output_{}'.format(i)))
+    graph = nx.DiGraph()
+    graph.add_nodes_from(pos)
+    graph.add_edges_from(edges)
     return graph, scale_and_pad(pos), labels
 
 
@@ -36,6 +36,8 @@ We can check the Eckerman-Hilton argument, up to interchanger.
 >>> assert s1 @ s0 == s1 >> s0 == (s0 @ s1).interchange(0, 1)
 """
 
+import numpy as np
+
 from discopy import cat, messages, drawing
 from discopy.cat import Ob, Functor, Quiver, AxiomError
 
@@ -114,20 +116,37 @@ class Ty(Ob):
         Ty('x', 'x', 'x')
 
         """
-        return Ty(*(self.objects + other.objects))
+        return Ty._from_objects(self._objects + other._objects)
 
     def __init__(self, *objects):
         self._objects = tuple(
             x if isinstance(x, Ob) else Ob(x) for x in objects)
         super().__init__(str(self))
 
+    @classmethod
+    def _from_objects(cls, objects):
+        """
+        Builds a type from a list of :class:`discopy.cat.Ob`, skipping the
+        checks and conversions in :code:`__init__`.
+        """
+        result = cls.__new__(cls)
+        result._objects = tuple(objects)
+        super(Ty, result).__init__(str(result))
+        return result
+
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Ty):
             return False
-        return self.objects == other.objects
+        return self._objects == other._objects
 
     def __hash__(self):
-        return hash(repr(self))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(repr(self))
+            return self._hash
 
     def __repr__(self):
         return "Ty({})".format(', '.join(repr(x.name) for x in self.objects))
@@ -136,16 +155,15 @@ class Ty(Ob):
         return ' @ '.join(map(str, self)) or 'Ty()'
 
     def __len__(self):
-        return len(self.objects)
+        return len(self._objects)
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        return iter(self._objects)
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return Ty(*self.objects[key])
-        return self.objects[key]
+            return Ty._from_objects(self._objects[key])
+        return self._objects[key]
 
     def __matmul__(self, other):
         return self.tensor(other)
@@ -156,7 +174,7 @@ class Ty(Ob):
     def __pow__(self, n_times):
         if not isinstance(n_times, int):
             raise TypeError(messages.type_err(int, n_times))
-        return sum(n_times * (self, ), type(self)())
+        return self._from_objects(self._objects * n_times)
 
 
 class PRO(Ty):
@@ -233,9 +251,9 @@ class Layer(cat.Box):
             *map(repr, (self._left, self._box, self._right)))
 
     def __str__(self):
-        return ("{} @ ".format(cat.Id(self._left)) if self._left else "")\
+        return ("Id({}) @ ".format(self._left) if self._left else "")\
             + str(self._box)\
-            + (" @ {}".format(cat.Id(self._right)) if self._right else "")
+            + (" @ Id({})".format(self._right) if self._right else "")
 
     def __getitem__(self, key):
         if key == slice(None, None, -1):
@@ -277,21 +295,73 @@ class Diagram(cat.Arrow):
             raise TypeError(messages.type_err(Ty, cod))
         if len(boxes) != len(offsets):
             raise ValueError(messages.boxes_and_offsets_must_have_same_len())
+        self._dom_len, self._cod_len = len(dom), len(cod)
         if layers is None:
-            layers = cat.Id(dom)
             for box, off in zip(boxes, offsets):
                 if not isinstance(box, Diagram):
                     raise TypeError(messages.type_err(Diagram, box))
                 if not isinstance(off, int):
                     raise TypeError(messages.type_err(int, off))
-                left = layers.cod[:off] if layers else dom[:off]
-                right = layers.cod[off + len(box.dom):]\
-                    if layers else dom[off + len(box.dom):]
-                layers = layers >> Layer(left, box, right)
-            layers = layers >> cat.Id(cod)
-        self._layers, self._offsets = layers, tuple(offsets)
+        self._offsets = tuple(offsets)
+        if layers is None:
+            layers = self._scan(dom, cod, boxes)
+        self._layers = layers
         super().__init__(dom, cod, boxes, _scan=False)
 
+    @staticmethod
+    def _arities(boxes):
+        """
+        The lengths of the domain and codomain of each box as NumPy columns.
+        """
+        dom_lens = np.array([box._dom_len for box in boxes], dtype=np.int32)
+        cod_lens = np.array([box._cod_len for box in boxes], dtype=np.int32)
+        return dom_lens, cod_lens
+
+    def _scan(self, dom, cod, boxes):
+        """
+        Checks that the boxes compose and returns the arrow of layers.
+
+        The number of wires at each step is a prefix sum over the box arities,
+        only the objects are checked one box at a time. Offsets out of range
+        are sliced as python lists, e.g. boxes with empty domain may be placed
+        at offset -1 or past the last wire.
+        """
+        offsets = np.array(self._offsets, dtype=np.int32)
+        dom_lens, cod_lens = self._arities(boxes)
+        widths = len(dom) + np.concatenate(
+            [[0], np.cumsum(cod_lens - dom_lens)])
+        fits = (offsets >= 0) & (offsets + dom_lens <= widths[:-1])
+        scan, layers = list(dom.objects), []
+
+        def prefix():  # The layers so far, only built for error messages.
+            return cat.Arrow(
+                dom, type(dom)._from_objects(scan), layers, _scan=False)\
+                if layers else cat.Id(dom)
+        for depth, (box, off) in enumerate(zip(boxes, self._offsets)):
+            end = off + box._dom_len
+            left, right = scan[:off], scan[end:]
+            if fits[depth]:
+                composes = scan[off: end] == box.dom.objects
+            else:
+                composes = left + box.dom.objects + right == scan
+            layer = Layer(type(dom)._from_objects(left), box,
+                          type(dom)._from_objects(right))
+            if not composes:
+                raise AxiomError(messages.does_not_compose(prefix(), layer))
+            layers.append(layer)
+            scan = left + box.cod.objects + right
+        if widths[-1] != len(cod) or scan != cod.objects:
+            raise AxiomError(messages.does_not_compose(prefix(), cat.Id(cod)))
+        return cat.Arrow(dom, cod, layers, _scan=False)
+
+    @staticmethod
+    def _upgrade(diagram):
+        """
+        Takes a monoidal.Diagram and returns a diagram of the same class,
+        overridden by subclasses.
+        """
+        return diagram
+
     @staticmethod
     def id(x):
         return Id(x)
@@ -324,10 +394,20 @@ class Diagram(cat.Arrow):
         return self._layers
 
     def then(self, other):
+        if not isinstance(other, Diagram):
+            raise TypeError(messages.type_err(Diagram, other))
+        if other is Id._empty and type(self) is Diagram and not self.cod:
+            return self
+        if self.cod != other.dom:
+            raise AxiomError(messages.does_not_compose(
+                self.layers, other.layers))
+        layers = cat.Arrow(self.dom, other.cod,
+                           self.layers._boxes + other.layers._boxes,
+                           _scan=False)
         return Diagram(self.dom, other.cod,
-                       self.boxes + other.boxes,
-                       self.offsets + other.offsets,
-                       layers=self.layers >> other.layers)
+                       self._boxes + other._boxes,
+                       self._offsets + other._offsets,
+                       layers=layers)
 
     def tensor(self, other):
         """
@@ -350,24 +430,32 @@ class Diagram(cat.Arrow):
         """
         if not isinstance(other, Diagram):
             raise TypeError(messages.type_err(Diagram, other))
+        if other is Id._empty and type(self) is Diagram:
+            return self
+        if self is Id._empty and type(other) is Diagram:
+            return other
         dom, cod = self.dom @ other.dom, self.cod @ other.cod
         boxes = self.boxes + other.boxes
-        offsets = self.offsets + [n + len(self.cod) for n in other.offsets]
-        layers = cat.Id(dom)
-        for left, box, right in self.layers:
-            layers = layers >> Layer(left, box, right @ other.dom)
-        for left, box, right in other.layers:
-            layers = layers >> Layer(self.cod @ left, box, right)
+        offsets = self.offsets\
+            + [off + self._cod_len for off in other._offsets]
+        layers = [Layer(left, box, right @ other.dom)
+                  for left, box, right in self.layers]
+        layers += [Layer(self.cod @ left, box, right)
+                   for left, box, right in other.layers]
+        layers = cat.Arrow(dom, cod, layers, _scan=False)
         return Diagram(dom, cod, boxes, offsets, layers=layers)
 
     def __matmul__(self, other):
         return self.tensor(other)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Diagram):
             return False
-        return all(self.__getattribute__(attr) == other.__getattribute__(attr)
-                   for attr in ['dom', 'cod', 'boxes', 'offsets'])
+        return self._offsets == other._offsets\
+            and self.dom == other.dom and self.cod == other.cod\
+            and self._boxes == other._boxes
 
     def __repr__(self):
         if not self.boxes:  # i.e. self is identity.
@@ -379,7 +467,15 @@ class Diagram(cat.Arrow):
             repr(self.boxes), repr(self.offsets))
 
     def __hash__(self):
-        return hash(repr(self))
+        try:
+            return self._hash
+        except AttributeError:
+            result = hash(repr(self))
+            # The data of boxes may be mutated, so their hash is not cached.
+            if all(isinstance(box, Box) and box.data is None
+                   for box in self._boxes):
+                self._hash = result
+            return result
 
     def __iter__(self):
         for left, box, right in self.layers:
@@ -394,10 +490,10 @@ class Diagram(cat.Arrow):
     def __getitem__(self, key):
         if isinstance(key, slice):
             layers = self.layers[key]
-            boxes_and_offsets = tuple(zip(*(
-                (box, len(left)) for left, box, _ in layers))) or ([], [])
-            inputs = (layers.dom, layers.cod) + boxes_and_offsets
-            return Diagram(*inputs, layers=layers)
+            boxes = [box for _, box, _ in layers]
+            offsets = list(self._offsets[key])
+            return Diagram(layers.dom, layers.cod, boxes, offsets,
+                           layers=layers)
         left, box, right = self.layers[key]
         return self.id(left) @ box @ self.id(right)
 
@@ -405,7 +501,8 @@ class Diagram(cat.Arrow):
         """
         Returns a new diagram with boxes i and j interchanged.
 
-        Gets called recursively whenever :code:`i < j + 1 or j < i - 1`.
+        Whenever :code:`j > i + 1 or j < i - 1`, the box is moved one step at
+        a time, see :meth:`Diagram._interchange_range`.
 
         Parameters
         ----------
@@ -432,42 +529,36 @@ class Diagram(cat.Arrow):
             raise IndexError
         if i == j:
             return self
-        if j < i - 1:
-            result = self
-            for k in range(i - j):
-                result = result.interchange(i - k, i - k - 1, left=left)
-            return result
-        if j > i + 1:
-            result = self
-            for k in range(j - i):
-                result = result.interchange(i + k, i + k + 1, left=left)
-            return result
-        if j < i:
-            i, j = j, i
-        off0, off1 = self.offsets[i], self.offsets[j]
-        left0, box0, right0 = self.layers[i]
-        left1, box1, right1 = self.layers[j]
-        # By default, we check if box0 is to the right first, then to the left.
-        if left and off1 >= off0 + len(box0.cod):  # box0 left of box1
-            off1 = off1 - len(box0.cod) + len(box0.dom)
-            middle = left1[len(left0 @ box0.cod):]
-            layer0 = Layer(left0, box0, middle @ box1.cod @ right1)
-            layer1 = Layer(left0 @ box0.dom @ middle, box1, right1)
-        elif off0 >= off1 + len(box1.dom):  # box0 right of box1
-            off0 = off0 - len(box1.dom) + len(box1.cod)
-            middle = left0[len(left1 @ box1.dom):]
-            layer0 = Layer(left1 @ box1.cod @ middle, box0, right0)
-            layer1 = Layer(left1, box1, middle @ box0.dom @ right0)
-        elif off1 >= off0 + len(box0.cod):  # box0 left of box1
-            off1 = off1 - len(box0.cod) + len(box0.dom)
-            middle = left1[len(left0 @ box0.cod):]
-            layer0 = Layer(left0, box0, middle @ box1.cod @ right1)
-            layer1 = Layer(left0 @ box0.dom @ middle, box1, right1)
-        else:
-            raise InterchangerError(box0, box1)
-        boxes = self.boxes[:i] + [box1, box0] + self.boxes[i + 2:]
-        offsets = self.offsets[:i] + [off1, off0] + self.offsets[i + 2:]
-        layers = self.layers[:i] >> layer1 >> layer0 >> self.layers[i + 2:]
+        return self._interchange_range(i, j, left=left)
+
+    def _interchange_range(self, i, j, left=False):
+        """
+        Moves box i to position j, swapping adjacent boxes in place on
+        lists of boxes, offsets and layers, then builds a single diagram.
+        """
+        boxes, offsets = self.boxes, self.offsets
+        layers = self.layers.boxes
+        steps = range(i - 1, j - 1, -1) if j < i else range(i, j)
+        for k in steps:
+            left0, box0, right0 = layers[k]
+            left1, box1, right1 = layers[k + 1]
+            move = _move(offsets[k], offsets[k + 1], box0._dom_len,
+                         box0._cod_len, box1._dom_len, box1._cod_len, left)
+            if move is None:
+                raise InterchangerError(box0, box1)
+            off1, off0, box0_is_right = move
+            if box0_is_right:
+                middle = left0[off1 + box1._dom_len:]
+                layer0 = Layer(left1 @ box1.cod @ middle, box0, right0)
+                layer1 = Layer(left1, box1, middle @ box0.dom @ right0)
+            else:
+                middle = left1[off0 + box0._cod_len:]
+                layer0 = Layer(left0, box0, middle @ box1.cod @ right1)
+                layer1 = Layer(left0 @ box0.dom @ middle, box1, right1)
+            boxes[k], boxes[k + 1] = box1, box0
+            offsets[k], offsets[k + 1] = off1, off0
+            layers[k], layers[k + 1] = layer1, layer0
+        layers = cat.Arrow(self.dom, self.cod, layers, _scan=False)
         return Diagram(self.dom, self.cod, boxes, offsets, layers=layers)
 
     def normalize(self, left=False):
@@ -494,19 +585,17 @@ class Diagram(cat.Arrow):
         s0 >> s1
         s1 >> s0
         """
+        def next_move(diagram, start):
+            return _find_next_move(
+                diagram._offsets, diagram._boxes, left, start)
         diagram = self
-        while True:
-            no_more_moves = True
-            for i in range(len(diagram) - 1):
-                box0, box1 = diagram.boxes[i], diagram.boxes[i + 1]
-                off0, off1 = diagram.offsets[i], diagram.offsets[i + 1]
-                if left and off1 >= off0 + len(box0.cod)\
-                        or not left and off0 >= off1 + len(box1.dom):
-                    diagram = diagram.interchange(i, i + 1, left=left)
-                    yield diagram
-                    no_more_moves = False
-            if no_more_moves:
-                break
+        i = next_move(diagram, 0)
+        while i >= 0:
+            while i >= 0:
+                diagram = diagram.interchange(i, i + 1, left=left)
+                yield diagram
+                i = next_move(diagram, i + 1)
+            i = next_move(diagram, 0)
 
     def normal_form(self, normalize=None, **params):
         """
@@ -526,12 +615,15 @@ class Diagram(cat.Arrow):
         NotImplementedError
             Whenever :code:`normalize` yields the same rewrite steps twice.
         """
-        diagram, cache = self, set()
+        diagram, cache = self, dict()
         for _diagram in (normalize or Diagram.normalize)(diagram, **params):
-            if _diagram in cache:
+            # Rewrite steps share their domain, so we compare boxes between
+            # steps with the same offsets, rather than hashing whole diagrams.
+            seen = cache.setdefault(_diagram._offsets, [])
+            if _diagram._boxes in seen:
                 raise NotImplementedError(messages.is_not_connected(self))
             diagram = _diagram
-            cache.add(diagram)
+            seen.append(diagram._boxes)
         return diagram
 
     def foliate(self, yield_slices=False):
@@ -569,9 +661,9 @@ class Diagram(cat.Arrow):
         def is_right_of(last, diagram):
             off0, off1 = diagram.offsets[last], diagram.offsets[last + 1]
             box0, box1 = diagram.boxes[last], diagram.boxes[last + 1]
-            if off1 >= off0 + len(box0.cod):  # box1 right of box0
+            if off1 >= off0 + box0._cod_len:  # box1 right of box0
                 return True
-            if off0 >= off1 + len(box1.dom):  # box1 left of box0
+            if off0 >= off1 + box1._dom_len:  # box1 left of box0
                 return False
             return None
 
@@ -649,9 +741,66 @@ class Diagram(cat.Arrow):
         >>> *_, last_diagram = diagram.foliate()
         >>> assert last_diagram == slices.flatten()
         """
-        *_, slices = self.foliate(yield_slices=True)
+        boxes, offsets, cuts = self._foliation_layout()
+        diagram = self._upgrade(Diagram(self.dom, self.cod, boxes, offsets))
+        slices = [diagram[i:j] for i, j in zip([0] + cuts[:-1], cuts)]
         return Diagram(self.dom, self.cod, slices, len(slices) * [0])
 
+    def _foliation_layout(self):
+        """
+        Computes the foliation of :meth:`Diagram.foliate` on lists of boxes
+        and offsets, without building the intermediate diagrams.
+
+        Returns
+        -------
+        boxes, offsets, cuts : tuple
+            where :code:`boxes` and :code:`offsets` are those of the last
+            rewrite step and :code:`cuts` is the list of indices where each
+            slice ends.
+        """
+        dom_lens = [box._dom_len for box in self._boxes]
+        cod_lens = [box._cod_len for box in self._boxes]
+
+        def swap(order, offsets, i):  # i.e. interchange(i + 1, i).
+            box0, box1 = order[i], order[i + 1]
+            move = _move(offsets[i], offsets[i + 1], dom_lens[box0],
+                         cod_lens[box0], dom_lens[box1], cod_lens[box1])
+            if move is None:
+                return False
+            order[i], order[i + 1] = box1, box0
+            offsets[i], offsets[i + 1], _ = move
+            return True
+
+        def move_in_slice(order, offsets, last, k):
+            for i in range(k - 1, last, -1):
+                if not swap(order, offsets, i):
+                    return False
+            while True:
+                box0, box1 = order[last], order[last + 1]
+                off0, off1 = offsets[last], offsets[last + 1]
+                if off1 >= off0 + cod_lens[box0]:  # box1 right of box0
+                    return True
+                if not off0 >= off1 + dom_lens[box1]:  # box1 left of box0
+                    return False
+                swap(order, offsets, last)
+                if not last:
+                    return True
+                last -= 1
+
+        order, offsets, cuts = list(range(len(self))), self.offsets, []
+        start = 0
+        while start < len(order):
+            last = start
+            for k in range(start + 1, len(order)):
+                _order, _offsets = order[start:k + 1], offsets[start:k + 1]
+                if move_in_slice(_order, _offsets, last - start, k - start):
+                    order[start:k + 1], offsets[start:k + 1] = _order, _offsets
+                    last += 1
+            cuts.append(last + 1)
+            start = last + 1
+        boxes = self.boxes
+        return [boxes[i] for i in order], offsets, cuts
+
     def depth(self):
         """
         Computes the depth of a diagram by foliating it
@@ -663,8 +812,14 @@ class Diagram(cat.Arrow):
         >>> assert (f @ g).depth() == 1
         >>> assert (f >> g).depth() == 2
         """
-        *_, slices = self.foliate(yield_slices=True)
-        return len(slices)
+        return self._slice_count()
+
+    def _slice_count(self):
+        """
+        Counts the slices of the foliation, without building them.
+        """
+        *_, cuts = self._foliation_layout()
+        return len(cuts)
 
     def width(self):
         """
@@ -676,12 +831,9 @@ class Diagram(cat.Arrow):
         >>> assert (f >> f.dagger()).width() == 4
         >>> assert (f @ Id(x ** 2) >> Id(x ** 2) @ f.dagger()).width() == 6
         """
-        scan = self.dom
-        width = len(scan)
-        for box, off in zip(self.boxes, self.offsets):
-            scan = scan[: off] + box.cod + scan[off + len(box.dom):]
-            width = max(width, len(scan))
-        return width
+        dom_lens, cod_lens = self._arities(self._boxes)
+        widths = self._dom_len + np.cumsum(cod_lens - dom_lens)
+        return int(np.max(widths, initial=self._dom_len))
 
     def draw(self, **params):
         """
@@ -743,13 +895,14 @@ def spiral(n_cups, _type=Ty('x')):
     """
     unit, counit = Box('unit', Ty(), _type), Box('counit', _type, Ty())
     cup, cap = Box('cup', _type @ _type, Ty()), Box('cap', Ty(), _type @ _type)
+    wires = [Id(_type ** i) for i in range(n_cups + 2)]
     result = unit
     for i in range(n_cups):
-        result = result >> Id(_type ** i) @ cap @ Id(_type ** (i + 1))
-    result = result >> Id(_type ** n_cups) @ counit @ Id(_type ** n_cups)
+        result = result >> wires[i] @ cap @ wires[i + 1]
+    result = result >> wires[n_cups] @ counit @ wires[n_cups]
     for i in range(n_cups):
         result = result >>\
-            Id(_type ** (n_cups - i - 1)) @ cup @ Id(_type ** (n_cups - i - 1))
+            wires[n_cups - i - 1] @ cup @ wires[n_cups - i - 1]
     return result
 
 
@@ -767,9 +920,24 @@ class Id(Diagram):
     >>> s, t = Ty('x', 'y'), Ty('z', 'w')
     >>> f = Box('f', s, t)
     >>> assert f >> Id(t) == f == Id(s) >> f
+
+    The identity on the empty type is only built once.
+
+    >>> assert Id(Ty()) is Id(Ty())
     """
+    _empty = None
+
+    def __new__(cls, x=None):
+        if cls is Id and type(x) is Ty and not x:
+            if Id._empty is None:
+                Id._empty = super().__new__(cls)
+                Diagram.__init__(Id._empty, x, x, [], [], layers=cat.Id(x))
+            return Id._empty
+        return super().__new__(cls)
+
     def __init__(self, x):
-        super().__init__(x, x, [], [], layers=cat.Id(x))
+        if self is not Id._empty:
+            super().__init__(x, x, [], [], layers=cat.Id(x))
 
     def __repr__(self):
         return "Id({})".format(repr(self.dom))
@@ -804,6 +972,52 @@ class Box(cat.Box, Diagram):
         return hash(repr(self))
 
 
+def _move(off0, off1, dom0, cod0, dom1, cod1, left=False):
+    """
+    Computes the offsets after interchanging two consecutive boxes, given
+    their offsets and the lengths of their domains and codomains.
+
+    By default, we check if box0 is to the right first, unless :code:`left`.
+
+    Returns
+    -------
+    move : tuple or None
+        :code:`(off1, off0, box0_is_right)` with the new offsets of box1 and
+        box0, or :code:`None` if the boxes are connected.
+
+    >>> _move(0, 1, 1, 1, 1, 1)
+    (1, 0, False)
+    >>> _move(0, 0, 1, 1, 1, 1) is None
+    True
+    """
+    box0_is_left, box0_is_right = off1 >= off0 + cod0, off0 >= off1 + dom1
+    if box0_is_left and (left or not box0_is_right):
+        return off1 - cod0 + dom0, off0, False
+    if box0_is_right:
+        return off1, off0 - dom1 + cod1, True
+    return None
+
+
+def _find_next_move(offsets, boxes, left, start):
+    """
+    Returns the first index :code:`i >= start` such that boxes i and i + 1
+    can be interchanged by :meth:`Diagram.normalize`, or -1 if there is none.
+
+    >>> x = Ty('x')
+    >>> d = Box('f', x, x) @ Box('g', x, x)
+    >>> _find_next_move(d._offsets, d._boxes, False, 0)
+    -1
+    >>> _find_next_move(d._offsets, d._boxes, True, 0)
+    0
+    """
+    for i in range(start, len(offsets) - 1):
+        if left and offsets[i + 1] >= offsets[i] + boxes[i]._cod_len\
+                or not left\
+                and offsets[i] >= offsets[i + 1] + boxes[i + 1]._dom_len:
+            return i
+    return -1
+
+
 class Functor(cat.Functor):
     """
     Implements a monoidal functor given its image on objects and arrows.
@@ -823,20 +1037,48 @@ class Functor(cat.Functor):
             ob_factory = Ty
         if ar_factory is None:
             ar_factory = Diagram
+        if isinstance(ob, dict):  # Images of types are cached, see __call__.
+            ob = dict(ob)
         super().__init__(ob, ar, ob_factory=ob_factory, ar_factory=ar_factory)
+        self._ob_cache = {}
 
     def __call__(self, diagram):
         if isinstance(diagram, Ty):
-            return sum([self.ob[type(diagram)(x)] for x in diagram],
-                       self.ob_factory())  # the empty type is the unit.
+            try:
+                return self._ob_cache[diagram]
+            except KeyError:
+                result = sum([self.ob[type(diagram)(x)] for x in diagram],
+                             self.ob_factory())  # the empty type is the unit.
+                self._ob_cache[diagram] = result
+                return result
         if isinstance(diagram, Box):
             return super().__call__(diagram)
         if isinstance(diagram, Diagram):
-            scan, result = diagram.dom, self.ar_factory.id(self(diagram.dom))
+            def lengths(x):
+                return [len(self(x[i:i + 1])) for i in range(len(x))]
+            # scan holds the length of the image of each wire.
+            scan = lengths(diagram.dom)
+            if diagram.boxes and isinstance(self.ar_factory, type)\
+                    and issubclass(self.ar_factory, Diagram)\
+                    and not issubclass(self.ar_factory, Box):
+                # The image is built in one go, from the boxes of the image
+                # of each box shifted by the length of the wires to its left.
+                boxes, offsets = [], []
+                for box, off in zip(diagram.boxes, diagram.offsets):
+                    image, img_off = self(box), sum(scan[:off])
+                    boxes += image.boxes
+                    offsets += [img_off + x for x in image.offsets]
+                    scan[off:off + box._dom_len] = lengths(box.cod)
+                return self.ar_factory(
+                    self(diagram.dom), self(diagram.cod), boxes, offsets)
+            result = self.ar_factory.id(self(diagram.dom))
             for box, off in zip(diagram.boxes, diagram.offsets):
-                id_l = self.ar_factory.id(self(scan[:off]))
-                id_r = self.ar_factory.id(self(scan[off + len(box.dom):]))
+                dom_len = box._dom_len
+                img_off = sum(scan[:off])
+                img_end = img_off + sum(scan[off:off + dom_len])
+                id_l = self.ar_factory.id(result.cod[:img_off])
+                id_r = self.ar_factory.id(result.cod[img_end:])
                 result = result >> id_l @ self(box) @ id_r
-                scan = scan[:off] + box.cod + scan[off + len(box.dom):]
+                scan[off:off + dom_len] = lengths(box.cod)
             return result
         raise TypeError(messages.type_err(Diagram, diagram))
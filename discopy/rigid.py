@@ -82,7 +82,7 @@ class Ty(monoidal.Ty, Ob):
         return Ty(*[x.r for x in self.objects[::-1]])
 
     def tensor(self, other):
-        return Ty(*super().tensor(other))
+        return Ty._from_objects(self._objects + other._objects)
 
     def __init__(self, *t):
         t = [x if isinstance(x, Ob)
@@ -91,9 +91,14 @@ class Ty(monoidal.Ty, Ob):
         monoidal.Ty.__init__(self, *t)
         Ob.__init__(self, str(self))
 
+    @classmethod
+    def _from_objects(cls, objects):
+        return super()._from_objects([
+            x if isinstance(x, Ob) else Ob(x.name) for x in objects])
+
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return Ty(*super().__getitem__(key))
+            return Ty._from_objects(self._objects[key])
         return super().__getitem__(key)
 
     def __repr__(self):
@@ -531,7 +536,13 @@ class Functor(monoidal.Functor):
         >>> assert F(f.transpose_r()) == F(f).transpose_r()
         """
         if isinstance(diagram, Ty):
-            return sum([self(b) for b in diagram.objects], self.ob_factory())
+            try:
+                return self._ob_cache[diagram]
+            except KeyError:
+                result = sum([self(b) for b in diagram.objects],
+                             self.ob_factory())
+                self._ob_cache[diagram] = result
+                return result
         if isinstance(diagram, Ob) and not diagram.z:
             return self.ob[Ty(diagram.name)]
         if isinstance(diagram, Ob):
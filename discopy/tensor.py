@@ -50,15 +50,16 @@ class Dim(Ty):
             return Dim(*[x.name for x in super().__getitem__(key)])
         return super().__getitem__(key).name
 
+    def __iter__(self):
+        for obj in self._objects:
+            yield obj.name
+
     def __repr__(self):
         return "Dim({})".format(', '.join(map(repr, self)) or '1')
 
     def __str__(self):
         return repr(self)
 
-    def __hash__(self):
-        return hash(repr(self))
-
     @property
     def l(self):
         """
@@ -222,7 +223,12 @@ class TensorFunctor(Functor):
 
     def __call__(self, diagram):
         if isinstance(diagram, Ty):
-            return sum(map(self, diagram.objects), Dim(1))
+            try:
+                return self._ob_cache[diagram]
+            except KeyError:
+                result = sum(map(self, diagram.objects), Dim(1))
+                self._ob_cache[diagram] = result
+                return result
         if isinstance(diagram, Ob):
             return Dim(self.ob[Ty(Ob(diagram.name, z=0))])
         if isinstance(diagram, Cup):
@@ -237,21 +243,23 @@ class TensorFunctor(Functor):
         if not isinstance(diagram, Diagram):
             raise TypeError(messages.type_err(Diagram, diagram))
 
-        def dim(scan):
-            return len(self(scan))
-        scan, array = diagram.dom, Id(self(diagram.dom)).array
+        def dims(scan):  # i.e. the number of axes for each wire.
+            return [len(self(obj)) for obj in scan.objects]
+        scan, array = dims(diagram.dom), Id(self(diagram.dom)).array
+        dom_dim = sum(scan)
         for box, off in zip(diagram.boxes, diagram.offsets):
-            left = dim(scan[:off])
-            if array.shape and self(box).array.shape:
-                source = list(range(dim(diagram.dom) + left,
-                                    dim(diagram.dom) + left + dim(box.dom)))
-                target = list(range(dim(box.dom)))
-                array = np.tensordot(array, self(box).array, (source, target))
+            left = sum(scan[:off])
+            dom_dims, cod_dims = dims(box.dom), dims(box.cod)
+            box_array = self(box).array
+            if array.shape and box_array.shape:
+                source = list(range(dom_dim + left,
+                                    dom_dim + left + sum(dom_dims)))
+                target = list(range(sum(dom_dims)))
+                array = np.tensordot(array, box_array, (source, target))
             else:
-                array = array * self(box).array
-            source = range(len(array.shape) - dim(box.cod), len(array.shape))
-            target = range(dim(diagram.dom) + left,
-                           dim(diagram.dom) + left + dim(box.cod))
+                array = array * box_array
+            source = range(len(array.shape) - sum(cod_dims), len(array.shape))
+            target = range(dom_dim + left, dom_dim + left + sum(cod_dims))
             array = np.moveaxis(array, list(source), list(target))
-            scan = scan[:off] + box.cod + scan[off + len(box.dom):]
+            scan[off:off + len(dom_dims)] = cod_dims
         return Tensor(self(diagram.dom), self(diagram.cod), array)
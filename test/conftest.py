@@ -0,0 +1,44 @@
+import functools
+from types import SimpleNamespace
+
+import pytest
+
+from discopy.grammar import Ty, Word, Cup, Id
+
+
+# Pregroup types and words are immutable, hence safe to share between tests.
+_mk_ty = functools.lru_cache(maxsize=256)(Ty)
+_mk_word = functools.lru_cache(maxsize=256)(Word)
+
+
+@pytest.fixture(scope="session")
+def mk_ty():
+    yield _mk_ty
+    _mk_ty.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def mk_word():
+    yield _mk_word
+    _mk_word.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def pregroup_toolbox(mk_ty, mk_word):
+    s, n = mk_ty('s'), mk_ty('n')
+    nr, nl, sl = n.r, n.l, s.l
+    return SimpleNamespace(
+        s=s, n=n, nr=nr, nl=nl, sl=sl,
+        Alice=mk_word('Alice', n), Bob=mk_word('Bob', n),
+        loves=mk_word('loves', nr @ s @ nl),
+        grammar=Cup(n, nr) @ Id(s) @ Cup(nl, n))
+
+
+@pytest.fixture(scope="session")
+def bf_expected(pregroup_toolbox):
+    Alice, Bob = pregroup_toolbox.Alice, pregroup_toolbox.Bob
+    loves, grammar = pregroup_toolbox.loves, pregroup_toolbox.grammar
+    return [Alice @ loves @ Alice >> grammar,
+            Alice @ loves @ Bob >> grammar,
+            Bob @ loves @ Alice >> grammar,
+            Bob @ loves @ Bob >> grammar]
@@ -1,8 +1,8 @@
+import io
 import os
-from pytest import raises
+import functools
 
 from PIL import Image, ImageChops
-from matplotlib import pyplot as plt
 from matplotlib.testing.compare import compare_images
 
 from discopy import *
@@ -11,22 +11,38 @@ from discopy import *
 IMG_FOLDER, TIKZ_FOLDER, TOL = 'test/imgs/', 'test/tikz/', 10
 
 
+def compare_drawing(file, folder, image, tmp_path, tol=TOL):
+    """
+    Byte-identical images match without decoding them, any other image is
+    written to tmp_path and compared to the reference with matplotlib's RMS.
+    Returns None if the images match, the error of compare_images otherwise.
+    """
+    true_path = os.path.join(folder, file)
+    with open(true_path, 'rb') as true:
+        if true.read() == image.getvalue():
+            return None
+    test_path = str(tmp_path / file)
+    with open(test_path, 'wb') as test:
+        test.write(image.getvalue())
+    return compare_images(true_path, test_path, tol)
+
+
 def draw_and_compare(file, folder=IMG_FOLDER, tol=TOL,
                      draw=Diagram.draw, **params):
     def decorator(func):
-        def wrapper():
-            true_path = os.path.join(folder, file)
-            test_path = os.path.join(folder, '.' + file)
-            draw(func(), path=test_path, **params)
-            test = compare_images(true_path, test_path, tol)
-            assert test is None
-            os.remove(test_path)
+        @functools.wraps(func)
+        def wrapper(*args, tmp_path, **kwargs):
+            image = io.BytesIO()
+            draw(func(*args, tmp_path=tmp_path, **kwargs),
+                 path=image, **params)
+            result = compare_drawing(file, folder, image, tmp_path, tol)
+            assert result is None, result
         return wrapper
     return decorator
 
 
 @draw_and_compare('crack-eggs.png', figsize=(5, 6), fontsize=18)
-def test_draw_eggs():
+def test_draw_eggs(tmp_path):
     def merge(x):
         return Box('merge', x @ x, x)
     egg, white, yolk = Ty('egg'), Ty('white'), Ty('yolk')
@@ -38,12 +54,12 @@ def test_draw_eggs():
 
 
 @draw_and_compare('spiral.png', draw_types=False, draw_box_labels=False)
-def test_draw_spiral():
+def test_draw_spiral(tmp_path):
     return monoidal.spiral(2)
 
 
 @draw_and_compare('who-ansatz.png')
-def test_draw_who():
+def test_draw_who(tmp_path):
     n, s = Ty('n'), Ty('s')
     copy, update = Box('copy', n, n @ n), Box('update', n @ s, s)
     return Cap(n.r, n)\
@@ -53,25 +69,21 @@ def test_draw_who():
 
 
 @draw_and_compare('sentence-as-diagram.png')
-def test_draw_sentence():
-    s, n = Ty('s'), Ty('n')
-    Alice, Bob = Word('Alice', n), Word('Bob', n)
-    loves = Word('loves', n.r @ s @ n.l)
-    return Alice @ loves @ Bob >> Cup(n, n.r) @ Id(s) @ Cup(n.l, n)
+def test_draw_sentence(pregroup_toolbox, tmp_path):
+    tb = pregroup_toolbox
+    return tb.Alice @ tb.loves @ tb.Bob >> tb.grammar
 
 
 @draw_and_compare('alice-loves-bob.png', draw=grammar.draw,
                   fontsize=18, fontsize_types=12,
                   figsize=(5, 2), margins=(0, 0))
-def test_pregroup_draw():
-    s, n = Ty('s'), Ty('n')
-    Alice, Bob = Word('Alice', n), Word('Bob', n)
-    loves = Word('loves', n.r @ s @ n.l)
-    return Alice @ loves @ Bob >> Cup(n, n.r) @ Id(s) @ Cup(n.l, n)
+def test_pregroup_draw(pregroup_toolbox, tmp_path):
+    tb = pregroup_toolbox
+    return tb.Alice @ tb.loves @ tb.Bob >> tb.grammar
 
 
 @draw_and_compare('bell-state.png', draw=Circuit.draw, draw_as_nodes=[0])
-def test_draw_bell_state():
+def test_draw_bell_state(tmp_path):
     return circuit.H @ circuit.Id(1) >> circuit.CX
 
 
@@ -99,40 +111,41 @@ def draw_equation(diagrams, **params):
 
 @draw_and_compare("snake-equation.png", draw=draw_equation,
                   aspect='auto', figsize=(5, 2), draw_types=False)
-def test_snake_equation():
+def test_snake_equation(tmp_path):
     x = Ty('x')
     return Id(x.r).transpose_l(), Id(x), Id(x.l).transpose_r()
 
 
 @draw_and_compare('typed-snake-equation.png', draw=draw_equation,
                   figsize=(5, 2), aspect='auto')
-def test_draw_typed_snake():
+def test_draw_typed_snake(tmp_path):
     x = Ty('x')
     return Id(x.r).transpose_l(), Id(x), Id(x.l).transpose_r()
 
 
 def tikz_and_compare(file, folder=TIKZ_FOLDER, draw=Diagram.draw, **params):
     def decorator(func):
-        def wrapper():
+        @functools.wraps(func)
+        def wrapper(*args, tmp_path, **kwargs):
             true_path = os.path.join(folder, file)
-            test_path = os.path.join(folder, '.' + file)
-            draw(func(), path=test_path, **params)
+            test_path = str(tmp_path / file)
+            draw(func(*args, tmp_path=tmp_path, **kwargs),
+                 path=test_path, **params)
             with open(true_path, "r") as true:
                 with open(test_path, "r") as test:
                     assert true.read() == test.read()
-            os.remove(test_path)
         return wrapper
     return decorator
 
 
 @tikz_and_compare("spiral.tex", to_tikz=True)
-def test_spiral_to_tikz():
+def test_spiral_to_tikz(tmp_path):
     return monoidal.spiral(2)
 
 
 @tikz_and_compare("copy.tex", to_tikz=True,
                   draw_as_nodes=True, draw_box_labels=False, color='black')
-def test_copy_to_tikz():
+def test_copy_to_tikz(tmp_path):
     x, y, z = map(Ty, ("$x$", "$y$", "$z$"))
     return Box('COPY', x, x @ x) @ Box('COPY', y, y @ y)\
         >> Id(x) @ Box("SWAP", x @ y, y @ x) @ Id(y)
@@ -140,23 +153,21 @@ def test_copy_to_tikz():
 
 @tikz_and_compare("alice-loves-bob.tex", to_tikz=True, draw=grammar.draw,
                   textpad=(.2, .2), textpad_words=(0, .25))
-def test_sentence_to_tikz():
-    s, n = Ty('s'), Ty('n')
-    Alice, Bob = Word('Alice', n), Word('Bob', n)
-    loves = Word('loves', n.r @ s @ n.l)
-    return Alice @ loves @ Bob >> Cup(n, n.r) @ Id(s) @ Cup(n.l, n)
+def test_sentence_to_tikz(pregroup_toolbox, tmp_path):
+    tb = pregroup_toolbox
+    return tb.Alice @ tb.loves @ tb.Bob >> tb.grammar
 
 
 @tikz_and_compare("snake-equation.tex", to_tikz=True, draw=draw_equation,
                   textpad=(.2, .2), textpad_words=(0, .25))
-def test_snake_equation_to_tikz():
+def test_snake_equation_to_tikz(tmp_path):
     x = Ty('x')
     return Id(x.r).transpose_l(), Id(x), Id(x.l).transpose_r()
 
 
 @tikz_and_compare("who-ansatz.tex", to_tikz="controls",
                   draw=draw_equation, symbol="$\\mapsto$")
-def test_who_ansatz_to_tikz():
+def test_who_ansatz_to_tikz(tmp_path):
     s, n = Ty('s'), Ty('n')
     who = Word('who', n.r @ n @ s.l @ n)
     who_ansatz = Cap(n.r, n)\
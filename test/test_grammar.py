@@ -1,15 +1,21 @@
 import os
+import re
+from itertools import islice
+import numpy as np
 from pytest import raises
-from matplotlib import pyplot as plt
-from matplotlib.testing.compare import compare_images
-from discopy.grammar import *
+from discopy import messages
+from discopy.grammar import Ty, Box, Word, CFG, eager_parse, brute_force, draw
 from discopy.rigid import Cap
 
 
+EXPECTED_OFFSETS = np.asarray([0, 1, 5, 8, 0, 2, 1, 1], dtype=np.int32)
+EXPECTED_OFFSETS.flags.writeable = False
+
+
 def test_Word():
-    with raises(TypeError):
+    with raises(TypeError, match=re.escape(messages.type_err(str, 0))):
         Word(0, Ty('n'))
-    with raises(TypeError):
+    with raises(TypeError, match=re.escape(messages.type_err(Ty, 0))):
         Word('Alice', 0)
 
 
@@ -22,36 +28,29 @@ def test_CFG():
     assert "CFG(Box('R0', Ty('VP', 'N'), Ty('S'))" in repr(cfg)
 
 
-def test_eager_parse():
-    s, n = Ty('s'), Ty('n')
-    Alice = Word('Alice', n)
-    loves = Word('loves', n.r @ s @ n.l)
-    Bob = Word('Bob', n)
-    grammar = Cup(n, n.r) @ Id(s) @ Cup(n.l, n)
+def test_eager_parse(pregroup_toolbox, mk_word):
+    n, nr, sl = pregroup_toolbox.n, pregroup_toolbox.nr, pregroup_toolbox.sl
+    Alice, Bob = pregroup_toolbox.Alice, pregroup_toolbox.Bob
+    loves, grammar = pregroup_toolbox.loves, pregroup_toolbox.grammar
     assert eager_parse(Alice, loves, Bob) == grammar << Alice @ loves @ Bob
-    who = Word('who', n.r @ n @ s.l @ n)
-    assert eager_parse(Bob, who, loves, Alice, target=n).offsets ==\
-        [0, 1, 5, 8, 0, 2, 1, 1]
+    who = mk_word('who', nr @ n @ sl @ n)
+    assert np.array_equal(np.asarray(
+        eager_parse(Bob, who, loves, Alice, target=n).offsets,
+        dtype=np.int32), EXPECTED_OFFSETS)
     with raises(NotImplementedError):
         eager_parse(Alice, Bob, loves)
     with raises(NotImplementedError):
         eager_parse(Alice, loves, Bob, who, loves, Alice)
 
 
-def test_brute_force():
-    s, n = Ty('s'), Ty('n')
-    Alice = Word('Alice', n)
-    loves = Word('loves', n.r @ s @ n.l)
-    Bob = Word('Bob', n)
-    grammar = Cup(n, n.r) @ Id(s) @ Cup(n.l, n)
-    gen = brute_force(Alice, loves, Bob)
-    assert next(gen) == Alice @ loves @ Alice >> grammar
-    assert next(gen) == Alice @ loves @ Bob >> grammar
-    assert next(gen) == Bob @ loves @ Alice >> grammar
-    assert next(gen) == Bob @ loves @ Bob >> grammar
-    gen = brute_force(Alice, loves, Bob, target=n)
-    assert next(gen) == Word('Alice', Ty('n'))
-    assert next(gen) == Word('Bob', Ty('n'))
+def test_brute_force(pregroup_toolbox, bf_expected):
+    n = pregroup_toolbox.n
+    Alice, Bob = pregroup_toolbox.Alice, pregroup_toolbox.Bob
+    loves = pregroup_toolbox.loves
+    assert list(islice(brute_force(Alice, loves, Bob), 4)) == bf_expected
+    expected = [Word('Alice', Ty('n')), Word('Bob', Ty('n'))]
+    assert list(islice(brute_force(Alice, loves, Bob, target=n), 2))\
+        == expected
 
 
 def test_pregroup_draw_errors():
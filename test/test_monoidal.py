@@ -33,6 +33,7 @@ def test_Ty_getitem():
 
 def test_Ty_pow():
     assert Ty('x') ** 42 == Ty('x') ** 21 @ Ty('x') ** 21
+    assert Ty('x') ** 0 == Ty() and PRO(2) ** 3 == PRO(6)
     with raises(TypeError) as err:
         Ty('x') ** Ty('y')
     assert messages.type_err(int, Ty('y'))
@@ -93,6 +94,29 @@ def test_Diagram_init():
 def test_Diagram_eq():
     assert Diagram(Ty('x'), Ty('x'), [], []) != Ty('x')
     assert Diagram(Ty('x'), Ty('x'), [], []) == Id(Ty('x'))
+    f = Box('f', Ty('x'), Ty('x'))
+    assert Diagram(Ty('x'), Ty('x'), (f, f), (0, 0)) == f >> f != f
+    assert f @ Id(Ty('x')) != Id(Ty('x')) @ f
+
+
+def test_Diagram_hash_mutable_data():
+    x = Ty('x')
+    f = Box('f', x, x, data=[1])
+    diagram = f >> f
+    hash(diagram)
+    f.data.append(2)
+    cache = {diagram: 1}
+    g = Box('f', x, x, data=[1, 2])
+    assert cache[g >> g] == 1
+
+
+def test_Diagram_hash_diagram_boxes():
+    x = Ty('x')
+    f, g = Box('f', x, x), Box('g', x, x)
+    diagram = Diagram(x, x, [f >> g], [0])
+    assert hash(diagram) == hash(Diagram(x, x, [f >> g], [0]))
+    foliation = (f @ g >> g @ f).foliation()
+    assert foliation in {foliation}
 
 
 def test_Diagram_iter():
@@ -141,6 +165,17 @@ def test_Diagram_tensor():
     assert str(err.value) == messages.type_err(Diagram, Ty('x'))
 
 
+def test_Diagram_then():
+    x, y = Ty('x'), Ty('y')
+    with raises(TypeError) as err:
+        Id(x) >> x
+    assert str(err.value) == messages.type_err(Diagram, x)
+    with raises(AxiomError) as err:
+        Box('f', x, y) >> Box('g', x, y)
+    assert str(err.value) == messages.does_not_compose(
+        Box('f', x, y), Box('g', x, y))
+
+
 def test_Diagram_offsets():
     assert Diagram(Ty('x'), Ty('x'), [], []).offsets == []
 
@@ -192,6 +227,12 @@ def test_Diagram_interchange():
         d.interchange(0, 2)
     assert str(err.value) == str(InterchangerError(f0, f1))
     assert d.interchange(2, 0) == Id(x) @ f1 >> f0 @ Id(x) >> f1 @ f0
+    fs = [Box('f{}'.format(i), x, x) for i in range(5)]
+    d = Diagram(x ** 5, x ** 5, fs, list(range(5)))
+    assert d.interchange(4, 0) == Diagram(
+        x ** 5, x ** 5, fs[4:] + fs[:4], [4, 0, 1, 2, 3])
+    assert d.interchange(4, 0).interchange(0, 4) == d
+    assert d.interchange(4, 0).layers[1] == Layer(Ty(), fs[0], x ** 4)
 
 
 def test_Diagram_normalize():
@@ -215,11 +256,33 @@ def test_Diagram_normal_form():
     assert (f0 @ f1).normal_form(left=True) == Id(x) @ f1 >> f0 @ Id(x)
 
 
+def test_Diagram_offsets_out_of_range():
+    x = Ty('x')
+    a, b = Box('a', Ty(), x), Box('b', Ty(), x)
+    assert Diagram(Ty(), x @ x, [a, b], [4, -1]).layers\
+        == (a >> b @ Id(x)).layers
+    assert Diagram(x @ x, x @ x, [Box('f', x, x)], [-2]).layers\
+        == (Box('f', x, x) @ Id(x)).layers
+
+
 def test_AxiomError():
     with raises(AxiomError) as err:
         Diagram(Ty('x'), Ty('x'), [Box('f', Ty('x'), Ty('y'))], [0])
     with raises(AxiomError) as err:
         Diagram(Ty('y'), Ty('y'), [Box('f', Ty('x'), Ty('y'))], [0])
+    x, y, z, w = Ty('x'), Ty('y'), Ty('z'), Ty('w')
+    f0, f1 = Box('f0', x, y), Box('f1', z, w)
+    with raises(AxiomError) as err:
+        Diagram(x @ z, y @ w, [f0, f1], [0, 2])
+    assert str(err.value) ==\
+        "f0 @ Id(z) does not compose with Id(y @ z) @ f1."
+    with raises(AxiomError) as err:
+        Diagram(x, x, [Box('f', x, x)], [1])
+    assert str(err.value) == "Id(x) does not compose with Id(x) @ f."
+    with raises(AxiomError) as err:
+        Diagram(z @ x, z @ w, [f0, f1], [1, 0])
+    assert str(err.value) ==\
+        "Id(z) @ f0 >> f1 @ Id(y) does not compose with Id(z @ w)."
 
 
 def test_InterchangerError():
@@ -237,6 +300,16 @@ def test_spiral(n_cups=2):
     assert spiral_nf.boxes[-1] == counit and spiral_nf.boxes[n_cups] == unit
 
 
+def test_Diagram_foliation():
+    x, y = Ty('x'), Ty('y')
+    f, g, h = Box('f', x, y), Box('g', y, x @ x), Box('h', x @ y, Ty())
+    diagram = f @ f @ f >> g @ Id(y @ y) >> Id(x) @ h @ Id(y) >> h
+    *_, slices = diagram.foliate(yield_slices=True)
+    assert diagram.foliation() == Diagram(
+        diagram.dom, diagram.cod, slices, len(slices) * [0])
+    assert spiral(3).foliation().flatten() == list(spiral(3).foliate())[-1]
+
+
 def test_Id_init():
     assert Id(Ty('x')) == Diagram.id(Ty('x'))
 
@@ -286,3 +359,28 @@ def test_Functor_call():
     with raises(TypeError) as err:
         F(F)
     assert str(err.value) == messages.type_err(Diagram, F)
+
+
+def test_Functor_ob_cache():
+    x, y = Ty('x'), Ty('y')
+    f = Box('f', x, x)
+    F = Functor({x: y @ y, y: Ty()}, {f: Box('g', y @ y, y @ y)})
+    assert F(x @ y @ x) is F(x @ y @ x) == y ** 4
+    assert F(Id(x @ y) @ f) == Id(y @ y) @ Box('g', y @ y, y @ y)
+    ob = {x: y, y: x}
+    F = Functor(ob, {})
+    assert F(x @ x) == y @ y
+    ob[x] = x
+    assert F(x @ x) == y @ y and F.ob == {x: y, y: x}
+
+
+def test_Functor_batch():
+    x, y = Ty('x'), Ty('y')
+    f, g = Box('f', x, x @ y), Box('g', y @ x, x)
+    F = Functor({x: y @ x, y: x}, {
+        f: Box('f', y @ x, y @ x @ x),
+        g: Box('g', x, y) @ Box('h', y @ x, x)})
+    diagram = f @ Id(x) >> Id(x) @ g
+    assert F(diagram) == F(f) @ Id(F(x)) >> Id(F(x)) @ F(g)
+    with raises(AxiomError):
+        Functor({x: x, y: y}, {f: Box('f', x, y), g: g})(diagram)